@@ -1,15 +1,16 @@
-import inspect
+import functools
 import logging
 import os
 import socket
 import sys
 import zoneinfo
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Tuple, Union
 
 import requests
 import urllib3
-from mastodon import Mastodon
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # noinspection PyPackageRequirements
 # it is there (python-telegram-bot)
@@ -21,33 +22,53 @@ CONSUMER_KEY = os.getenv("CONSUMER_KEY")
 CONSUMER_SECRET = os.getenv("CONSUMER_SECRET")
 ACCESS_TOKEN = os.getenv("ACCESS_TOKEN")
 ACCESS_TOKEN_SECRET = os.getenv("ACCESS_TOKEN_SECRET")
+MASTODON_ACCESS_TOKEN = os.getenv("MASTODON_ACCESS_TOKEN")
+MASTODON_INSTANCE_URL = os.getenv("MASTODON_INSTANCE_URL") or "https://mastodon.social"
+
+_UTC = zoneinfo.ZoneInfo("UTC")
+_BERLIN = zoneinfo.ZoneInfo("Europe/Berlin")
+
+SESSION = requests.Session()
+SESSION.headers["Connection"] = "keep-alive"
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                                      max_retries=Retry(total=2, backoff_factor=0.2,
+                                                        status_forcelist=[502, 503, 504], raise_on_status=False)))
 
 
 def create_logger(name: str, level: int = logging.DEBUG) -> logging.Logger:
-    logger = logging.Logger(name)
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+
     ch = logging.StreamHandler(sys.stdout)
 
-    formatting = "[{}] %(asctime)s\t%(levelname)s\t%(module)s.%(funcName)s#%(lineno)d | %(message)s".format(name)
-    formatter = logging.Formatter(formatting)
-    ch.setFormatter(formatter)
+    formatting = f"[{name}] %(asctime)s\t%(levelname)s\t%(module)s.%(funcName)s#%(lineno)d | %(message)s"
+    ch.setFormatter(logging.Formatter(formatting))
 
     logger.addHandler(ch)
     logger.setLevel(level)
+    logger.propagate = False
 
     return logger
 
 
+logger = create_logger("tweeter")
+
+
+@functools.lru_cache(maxsize=8)
+def temperature_url(precision: int, format_region: str) -> str:
+    return f"{BACKEND_URL}/{BACKEND_PATH.format(WOOG_UUID)}?precision={precision}&formatRegion={format_region}"
+
+
 def get_temperature(*, precision: int = 2, format_region: str = "DE") -> Tuple[bool, Union[Tuple[str, str], str]]:
-    logger = create_logger(inspect.currentframe().f_code.co_name)
-    path = BACKEND_PATH.format(WOOG_UUID)
-    url = "/".join([BACKEND_URL, path])
-    url += f"?precision={precision}&formatRegion={format_region}"
+    url = temperature_url(precision, format_region)
 
     logger.debug(f"Calling {url}")
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=(3.05, 5))
         logger.debug(f"success: {response.ok} | content: {response.content}")
-    except (requests.exceptions.ConnectionError, socket.gaierror, urllib3.exceptions.MaxRetryError) as e:
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, socket.gaierror,
+            urllib3.exceptions.MaxRetryError) as e:
         logger.exception(f"Error while connecting to backend ({url})", exc_info=True)
         return False, f"Error while connecting to backend: {e}"
 
@@ -59,15 +80,13 @@ def get_temperature(*, precision: int = 2, format_region: str = "DE") -> Tuple[b
 
 
 def format_twoot(temperature: str, isotime: str) -> Tuple[bool, str]:
-    logger = create_logger(inspect.currentframe().f_code.co_name)
-
-    fromtime = datetime.fromisoformat(isotime.replace("Z", ""))
-    utctime = datetime(fromtime.year, fromtime.month, fromtime.day, fromtime.hour, fromtime.minute, fromtime.second,
-                       tzinfo=zoneinfo.ZoneInfo("UTC"))
-    time = utctime.astimezone(zoneinfo.ZoneInfo("Europe/Berlin"))
-    time_formatted = time.strftime("%H:%M %d.%m.%Y")
+    utctime = datetime.fromisoformat(isotime)
+    if utctime.tzinfo is None:
+        utctime = utctime.replace(tzinfo=_UTC)
+    time = utctime.astimezone(_BERLIN)
+    time_formatted = f"{time.hour:02d}:{time.minute:02d} {time.day:02d}.{time.month:02d}.{time.year}"
 
-    now = datetime.now(tz=timezone.utc).astimezone(zoneinfo.ZoneInfo("Europe/Berlin"))
+    now = datetime.now(tz=_BERLIN)
     diff_minutes = (now - time).total_seconds() / 60
     logger.debug(f"time: {time} | now: {now} | diff (min): {diff_minutes}")
     if diff_minutes > 115:
@@ -76,18 +95,26 @@ def format_twoot(temperature: str, isotime: str) -> Tuple[bool, str]:
     return True, f"Der Woog hat eine Temperatur von {temperature}°C ({time_formatted}) #woog #wooglife #darmstadt"
 
 
-def send_temperature_toot(message: str) -> Tuple[bool, str]:
-    access_token = os.getenv("MASTODON_ACCESS_TOKEN")
-    instance_url = os.getenv("MASTODON_INSTANCE_URL", "https://mastodon.social")
-    mastodon = Mastodon(api_base_url=instance_url, access_token=access_token)
+_MASTODON = None
+
+
+def get_mastodon():
+    global _MASTODON
+    if _MASTODON is None:
+        from mastodon import Mastodon
+
+        _MASTODON = Mastodon(api_base_url=MASTODON_INSTANCE_URL, access_token=MASTODON_ACCESS_TOKEN)
 
-    mastodon.toot(message)
+    return _MASTODON
+
+
+def send_temperature_toot(message: str) -> Tuple[bool, str]:
+    get_mastodon().status_post(message)
 
     return True, ""
 
 
 def main() -> Tuple[bool, str]:
-    logger = create_logger(inspect.currentframe().f_code.co_name)
     # noinspection PyShadowingNames
     success, value = get_temperature()
 